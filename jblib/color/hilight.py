@@ -175,12 +175,10 @@ class hilightV2:
         """
         Apply formatting using ANSI escape codes.
         """
-        attr = [color_code]
-
         if bold:
-            attr.append('1')
+            color_code += ';1'
 
-        return '\x1b[%sm%s\x1b[0m' % (';'.join(attr), self._text)
+        return '\x1b[%sm%s\x1b[0m' % (color_code, self._text)
 
     def red(self, bold=False):
         """Format the text with red color."""
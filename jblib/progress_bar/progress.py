@@ -1,4 +1,9 @@
 import sys
+from functools import lru_cache
+
+_FULL_BAR = "█" * 256
+_EMPTY_BAR = "▬" * 256
+_last_state = [None]
 
 def progress_bar(progress, barLength=50, text_field="Progress"):
     """
@@ -7,6 +12,7 @@ def progress_bar(progress, barLength=50, text_field="Progress"):
     Accepts a float between 0 and 1. Any int will be converted to a float.
     A value under 0 represents a 'halt'.
     A value at 1 or bigger represents 100%.
+    Calls that would redraw an identical bar are skipped.
 
     Parameters:
     - progress: A float between 0 and 1.
@@ -25,9 +31,60 @@ def progress_bar(progress, barLength=50, text_field="Progress"):
     if progress >= 1:
         progress = 1
         status = "Done...\r\n"
-    block = int(round(barLength * progress))
-    text = "\r{3}: {0} {1}%  {2}".format("█" * block + "▬" * (barLength - block), round(progress * 100), status, text_field)
-    print(text, end='\r')
+    block = int(barLength * progress + 0.5)
+    pct = int(progress * 100 + 0.5)
+    state = (block, pct, barLength, text_field, status)
+    if state == _last_state[0] and status == " \r":
+        return
+    _last_state[0] = state
+    if 0 <= barLength <= len(_FULL_BAR):
+        bar = _FULL_BAR[:block] + _EMPTY_BAR[:barLength - block]
+    else:
+        bar = "█" * block + "▬" * (barLength - block)
+    sys.stdout.write(f"\r{text_field}: {bar} {pct}%  {status}\r")
+
+_BAR_COLORS = {
+    'green': (0, 255, 0),
+    'red': (255, 0, 0),
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'white': (255, 255, 255),
+    'purple': (128, 0, 128),
+    'cyan': (0, 255, 255),
+}
+
+@lru_cache(maxsize=64)
+def _gradient_cells(barLength):
+    """
+    Returns the colored '▬' cell for every position of a gradient bar of the given length.
+
+    The colors only depend on the bar length, so they are computed in a single pass and
+    cached; repeated updates of the same bar reuse them. A cell that has the same color as
+    the one before it is emitted without an escape code.
+    """
+    colors = [_BAR_COLORS[name] for name in ('red', 'yellow', 'green')]
+    num_colors = len(colors)
+    segments = []
+    for idx in range(num_colors):
+        r1, g1, b1 = colors[idx]
+        r2, g2, b2 = colors[min(idx + 1, num_colors - 1)]
+        segments.append((r1, g1, b1, r2 - r1, g2 - g1, b2 - b1))
+
+    template = '\033[38;2;%d;%d;%dm▬'
+    cells = []
+    previous = None
+    for i in range(barLength):
+        char_progress = i / barLength
+        color_idx = int(char_progress * num_colors)
+        t = (char_progress * num_colors) - color_idx
+        r1, g1, b1, dr, dg, db = segments[color_idx]
+        rgb = (int(r1 + t * dr), int(g1 + t * dg), int(b1 + t * db))
+        if rgb == previous:
+            cells.append('▬')
+        else:
+            cells.append(template % rgb)
+            previous = rgb
+    return tuple(cells)
 
 def colored_progress_bar(progress, barLength=50, text_field="Progress"):
     """
@@ -38,30 +95,6 @@ def colored_progress_bar(progress, barLength=50, text_field="Progress"):
     - barLength: Length of the progress bar in characters.
     - text_field: Text to display before the progress bar.
     """
-    def interpolate_color(color1, color2, t):
-        """
-        Interpolate between two colors based on a parameter t.
-        """
-        colors = {
-            'green': (0, 255, 0),
-            'red': (255, 0, 0),
-            'blue': (0, 0, 255),
-            'yellow': (255, 255, 0),
-            'white': (255, 255, 255),
-            'purple': (128, 0, 128),
-            'cyan': (0, 255, 255),
-        }
-
-        r1, g1, b1 = colors[color1]
-        r2, g2, b2 = colors[color2]
-        r = int(r1 + t * (r2 - r1))
-        g = int(g1 + t * (g2 - g1))
-        b = int(b1 + t * (b2 - b1))
-        return f'\033[38;2;{r};{g};{b}m'
-
-    colors = ['red', 'yellow', 'green']
-    num_colors = len(colors)
-
     status = " \r"
     if isinstance(progress, int):
         progress = float(progress)
@@ -75,19 +108,13 @@ def colored_progress_bar(progress, barLength=50, text_field="Progress"):
         progress = 1
         status = "Done...\r\n"
 
-    text = text_field + ": "
-    for i in range(barLength):
-        char_progress = i / barLength
-        color_idx1 = int(char_progress * num_colors)
-        color_idx2 = color_idx1 + 1 if color_idx1 < num_colors - 1 else num_colors - 1
-        t = (char_progress * num_colors) - color_idx1
-        char_color1 = colors[color_idx1]
-        char_color2 = colors[color_idx2]
-        char_color = interpolate_color(char_color1, char_color2, t)
-        if char_progress <= progress:
-            text += char_color + '▬'
+    parts = [text_field + ": "]
+    for i, cell in enumerate(_gradient_cells(barLength)):
+        if i / barLength <= progress:
+            parts.append(cell)
         else:
-            text += ' '
-    text += ' {:.0f}% {}'.format(progress * 100, status)
-    sys.stdout.write(text + '\033[0m')
+            parts.append(' ')
+    parts.append(' {:.0f}% {}'.format(progress * 100, status))
+    parts.append('\033[0m')
+    sys.stdout.write(''.join(parts))
     sys.stdout.flush()
\ No newline at end of file